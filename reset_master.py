@@ -1,5 +1,8 @@
 ﻿import sqlite3, pathlib
-from werkzeug.security import generate_password_hash
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# scrypt runs in OpenSSL's C code; pin it so the hash doesn't depend on Werkzeug's default.
+HASH_METHOD = "scrypt:32768:8:1"
 
 db = pathlib.Path.home() / ".legal_time_tracker_web" / "time_tracker.db"
 print("DB path:", db)
@@ -7,16 +10,25 @@ print("DB path:", db)
 con = sqlite3.connect(str(db))
 cur = con.cursor()
 
-cur.execute(
-    "update users set password_hash=? where lower(email)=? or lower(name)=?",
-    (generate_password_hash("ilovemyjob"), "law@local", "law"),
-)
-con.commit()
-
-row = cur.execute(
-    "select id, name, email from users where lower(email)=? or lower(name)=?",
+rows = cur.execute(
+    "select id, name, email, password_hash from users where lower(email)=? or lower(name)=?",
     ("law@local", "law"),
-).fetchone()
-print("Reset for:", row)
+).fetchall()
+
+# Only rehash + commit when the stored hash is stale or doesn't already verify.
+if any(
+    not (r[3] or "").startswith(HASH_METHOD + "$")
+    or not check_password_hash(r[3], "ilovemyjob")
+    for r in rows
+):
+    cur.execute(
+        "update users set password_hash=? where lower(email)=? or lower(name)=?",
+        (generate_password_hash("ilovemyjob", method=HASH_METHOD), "law@local", "law"),
+    )
+    con.commit()
+elif rows:
+    print("Password already current; nothing to write.")
+
+print("Reset for:", rows[0][:3] if rows else None)
 
 con.close()